@@ -16,6 +16,7 @@
 
 """Abstract base classes."""
 import logging
+from types import MemberDescriptorType
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -34,9 +35,29 @@ logger = logging.getLogger(__name__)
 __all__ = ["_XMLObject"]
 
 
+_SLOT_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _get_slot_names(cls: type) -> Tuple[str, ...]:
+    """Return the names of the slots of a class and its parents, cached per class."""
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = _SLOT_NAMES[cls] = tuple(
+            name
+            for klass in cls.__mro__
+            for name, attr in vars(klass).items()
+            if isinstance(attr, MemberDescriptorType)
+        )
+    return names
+
+
 class _XMLObject:
     """XML Baseclass."""
 
+    # Subclasses may declare __slots__ for their attributes, the __dict__ slot
+    # keeps arbitrary keyword arguments working.
+    __slots__ = ("__dict__", "__kwarg_keys", "__weakref__", "name_spaces", "ns")
+
     _default_nsid: str = ""
     _node_name: str = ""
     name_spaces: Dict[str, str]
@@ -118,7 +139,39 @@ class _XMLObject:
         if type(self) is not type(other):
             return False
         assert isinstance(other, type(self))  # noqa: S101
-        return self.__dict__ == other.__dict__
+        return self.__dict__ == other.__dict__ and all(
+            getattr(self, name, None) == getattr(other, name, None)
+            for name in _get_slot_names(type(self))
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Return the state of the object for pickling.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The instance dictionary and the values of the set slots.
+
+        """
+        state = dict(self.__dict__)
+        for name in _get_slot_names(type(self)):
+            if hasattr(self, name):
+                state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the state of the object when unpickling.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state returned by ``__getstate__``.
+
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
 
     def etree_element(
         self,
@@ -144,16 +197,12 @@ class _XMLObject:
         element: Element = config.etree.Element(
             f"{self.ns}{self.get_tag_name()}",
         )
-        for item in registry.get(self.__class__):
-            item.set_element(
-                obj=self,
-                element=element,
-                attr_name=item.attr_name,
-                node_name=item.node_name,
-                precision=precision,
-                verbosity=verbosity,
-                default=item.default,
-            )
+        registry.sub_element(
+            self,
+            element=element,
+            precision=precision,
+            verbosity=verbosity,
+        )
         return element
 
     def to_string(
@@ -288,22 +337,14 @@ class _XMLObject:
         name_spaces = name_spaces or {}
         name_spaces = {**config.NAME_SPACES, **name_spaces}
         kwargs: Dict[str, Any] = {"ns": ns, "name_spaces": name_spaces}
-        for item in registry.get(cls):
-            for name_space in item.ns_ids:
-                kwarg = item.get_kwarg(
-                    element=element,
-                    ns=name_spaces.get(name_space, ""),
-                    name_spaces=name_spaces,
-                    node_name=item.node_name,
-                    kwarg=item.attr_name,
-                    classes=item.classes,
-                    strict=strict,
-                )
-                if kwarg:
-                    kwargs.update(
-                        kwarg,
-                    )
-                    break
+        kwargs.update(
+            registry.get_kwargs(
+                cls,
+                element=element,
+                name_spaces=name_spaces,
+                strict=strict,
+            ),
+        )
         return kwargs
 
     @classmethod
@@ -35,7 +35,10 @@ try:  # pragma: no cover
     from lxml import etree
 
 except ImportError:  # pragma: no cover
-    warnings.warn("Package `lxml` missing. Pretty print will be disabled")  # noqa: B028
+    warnings.warn(  # noqa: B028
+        "Package `lxml` missing. Pretty print will be disabled "
+        "and parsing and serializing will be slower.",
+    )
     import xml.etree.ElementTree as etree  # noqa: N813
 
 
@@ -43,9 +46,17 @@ logger = logging.getLogger(__name__)
 
 
 def set_etree_implementation(implementation: ModuleType) -> None:
-    """Set the etree implementation to use."""
+    """
+    Set the etree implementation to use.
+
+    The helpers bind ``SubElement`` at module level to keep the lookup off the
+    serialization hot path, rebind it to the new implementation.
+    """
     global etree  # noqa: PLW0603
     etree = implementation
+    from fastkml import helpers  # noqa: PLC0415
+
+    helpers._SubElement = implementation.SubElement  # noqa: SLF001
 
 
 KML: Final = "kml"
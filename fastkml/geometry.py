@@ -136,6 +136,7 @@ def coordinates_subelement(
     element: Element,
     attr_name: str,
     node_name: str,  # noqa: ARG001
+    qname: str,  # noqa: ARG001
     precision: Optional[int],
     verbosity: Optional[Verbosity],  # noqa: ARG001
     default: Any,  # noqa: ARG001
@@ -149,6 +150,7 @@ def coordinates_subelement(
         element (Element): The parent element to add the subelement to.
         attr_name (str): The name of the attribute to retrieve the value from.
         node_name (str): The name of the subelement to create.
+        qname (str): The qualified name of the subelement to create.
         precision (Optional[int]): The precision of the attribute value.
         verbosity (Optional[Verbosity]): The verbosity level.
         default (Any): The default value of the attribute (unused).
@@ -158,9 +160,8 @@ def coordinates_subelement(
         None
 
     """
-    if getattr(obj, attr_name, None):
+    if coords := getattr(obj, attr_name, None):
         p = precision if precision is not None else 6
-        coords = getattr(obj, attr_name)
         if len(coords[0]) == 2:  # noqa: PLR2004
             tuples = (f"{c[0]:.{p}f},{c[1]:.{p}f}" for c in coords)
         elif len(coords[0]) == 3:  # noqa: PLR2004
@@ -174,29 +175,31 @@ def coordinates_subelement(
 def subelement_coordinates_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],  # noqa: ARG001
     ns: str,  # noqa: ARG001
     name_spaces: Dict[str, str],  # noqa: ARG001
-    node_name: str,  # noqa: ARG001
-    kwarg: str,
+    qname: str,  # noqa: ARG001
     classes: Tuple[known_types, ...],  # noqa: ARG001
     strict: bool,
-) -> Dict[str, LineType]:
+) -> Tuple[bool, Optional[LineType]]:
     """
-    Extract coordinates from a subelement and returns them as a dictionary.
+    Extract coordinates from a subelement.
 
     Args:
     ----
         element (Element): The XML element containing the coordinates.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the XML element.
         name_spaces (Dict[str, str]): A dictionary mapping namespace prefixes to URIs.
-        node_name (str): The name of the XML node containing the coordinates.
-        kwarg (str): The name of the keyword argument to store the coordinates.
+        qname (str): The qualified name of the XML node containing the coordinates.
         classes (Tuple[known_types, ...]): A tuple of known types for validation.
         strict (bool): A flag indicating whether to raise an error for invalid geometry.
 
     Returns:
     -------
-        Dict[str, LineType]: A dictionary containing the extracted coordinates.
+        Tuple[bool, Optional[LineType]]: Whether coordinates were found,
+            and the extracted coordinates.
 
     Raises:
     ------
@@ -206,20 +209,18 @@ def subelement_coordinates_kwarg(
     try:
         latlons = re.sub(r", +", ",", element.text.strip()).split()
     except AttributeError:
-        return {}
+        return False, None
     try:
-        return {
-            kwarg: [  # type: ignore[dict-item]
-                tuple(float(c) for c in latlon.split(",")) for latlon in latlons
-            ],
-        }
+        return True, [  # type: ignore[return-value]
+            tuple(float(c) for c in latlon.split(",")) for latlon in latlons
+        ]
     except ValueError as error:
         handle_invalid_geometry_error(
             error=error,
             element=element,
             strict=strict,
         )
-        return {}
+        return False, None
 
 
 class Coordinates(_XMLObject):
@@ -15,10 +15,22 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 """Helper functions for fastkml."""
 
+# Performance notes:
+# The hot paths in this module are string handling, dict lookups and
+# ElementTree traversal, called once per attribute of every element.
+# They are made fast by using lxml when it is installed and by doing as little
+# per element work as possible: the registry caches the items and qualified
+# names, and the children of an element are grouped by tag in one pass.
+# JIT compilers such as Numba do not apply here, they only compile numeric
+# code and fall back to object mode, which is slower than plain CPython, for
+# code working on strings and XML elements.
+
 import logging
+import sys
 from enum import Enum
 from typing import Any
 from typing import Dict
+from typing import Final
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -33,6 +45,37 @@ from fastkml.types import Element
 
 logger = logging.getLogger(__name__)
 
+# Rebound by ``config.set_etree_implementation``.
+_SubElement = config.etree.SubElement
+
+_TRUE_VALUES: Final = frozenset(("1", "true"))
+_FALSE_VALUES: Final = frozenset(("0", "false"))
+_BOOL_STR: Final = ("0", "1")
+_FLOAT_FORMATS: Dict[int, str] = {}
+_CLASS_QNAMES: Dict[Tuple[Type[_XMLObject], str], str] = {}
+
+
+def class_qname(cls: Type[_XMLObject], ns: str) -> str:
+    """
+    Return the qualified tag name of a class in a namespace.
+
+    The names are cached per class and namespace.
+
+    Args:
+    ----
+        cls (Type[_XMLObject]): The class to get the tag name for.
+        ns (str): The namespace.
+
+    Returns:
+    -------
+        str: The qualified tag name.
+
+    """
+    qname = _CLASS_QNAMES.get((cls, ns))
+    if qname is None:
+        qname = _CLASS_QNAMES[(cls, ns)] = sys.intern(f"{ns}{cls.get_tag_name()}")
+    return qname
+
 
 def handle_error(
     *,
@@ -109,12 +152,43 @@ def get_value(
     return None if value == default and verbosity == Verbosity.terse else value
 
 
+def format_float(value: float, precision: Optional[int]) -> str:
+    """
+    Format a float with at most the given number of decimals.
+
+    Trailing zeros are dropped, so ``1.5`` is written as ``1.5`` and ``20.0``
+    as ``20`` whatever the precision.
+    Values that round to zero are written as ``0``, never as ``-0``.
+
+    Args:
+    ----
+        value (float): The value to format.
+        precision (Optional[int]): The maximum number of decimals, ``None``
+            writes the shortest representation that round-trips.
+
+    Returns:
+    -------
+        str: The formatted value.
+
+    """
+    if precision is None:
+        return str(value)
+    spec = _FLOAT_FORMATS.get(precision)
+    if spec is None:
+        spec = _FLOAT_FORMATS[precision] = f".{precision}f"
+    text = format(value, spec)
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
 def node_text(
     obj: _XMLObject,
     *,
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[str],
@@ -132,6 +206,8 @@ def node_text(
         The name of the attribute in the object.
     node_name : str
         The name of the XML node (unused).
+    qname : str
+        The qualified name of the XML node (unused).
     precision : Optional[int]
         The precision to use when converting numeric values to text (unused).
     verbosity : Optional[Verbosity]
@@ -160,6 +236,7 @@ def text_subelement(
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[str],
@@ -173,6 +250,7 @@ def text_subelement(
         element (Element): The parent element to add the subelement to.
         attr_name (str): The name of the attribute to retrieve the value from.
         node_name (str): The name of the subelement to create.
+        qname (str): The qualified name of the subelement to create.
         precision (Optional[int]): The precision of the attribute value.
         verbosity (Optional[Verbosity]): The verbosity level.
         default (Optional[str]): The default value for the attribute.
@@ -188,10 +266,7 @@ def text_subelement(
         verbosity=verbosity,
         default=default,
     ):
-        subelement = config.etree.SubElement(
-            element,
-            f"{obj.ns}{node_name}",
-        )
+        subelement = _SubElement(element, qname)
         subelement.text = value
 
 
@@ -201,6 +276,7 @@ def text_attribute(
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[str],
@@ -214,6 +290,7 @@ def text_attribute(
         element (Element): The parent element to add the subelement to.
         attr_name (str): The name of the attribute to retrieve the value from.
         node_name (str): The name of the attribute to be set.
+        qname (str): The qualified name of the attribute (unused).
         precision (Optional[int]): The precision of the attribute value.
         verbosity (Optional[Verbosity]): The verbosity level.
         default (Optional[str]): The default value for the attribute.
@@ -238,6 +315,7 @@ def bool_subelement(
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[bool],
@@ -251,6 +329,7 @@ def bool_subelement(
         element (Element): The parent element to add the subelement to.
         attr_name (str): The name of the attribute to retrieve the value from.
         node_name (str): The name of the subelement to create.
+        qname (str): The qualified name of the subelement to create.
         precision (Optional[int]): The precision of the attribute value.
         verbosity (Optional[Verbosity]): The verbosity level.
         default (Optional[bool]): The default value for the attribute.
@@ -262,11 +341,8 @@ def bool_subelement(
     """
     value = get_value(obj, attr_name=attr_name, verbosity=verbosity, default=default)
     if value is not None:
-        subelement = config.etree.SubElement(
-            element,
-            f"{obj.ns}{node_name}",
-        )
-        subelement.text = str(int(value))
+        subelement = _SubElement(element, qname)
+        subelement.text = _BOOL_STR[bool(value)]
 
 
 def int_subelement(
@@ -275,6 +351,7 @@ def int_subelement(
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[int],
@@ -288,6 +365,7 @@ def int_subelement(
         element (Element): The parent element to add the subelement to.
         attr_name (str): The name of the attribute to retrieve the value from.
         node_name (str): The name of the subelement to create.
+        qname (str): The qualified name of the subelement to create.
         precision (Optional[int]): The precision of the attribute value.
         verbosity (Optional[Verbosity]): The verbosity level.
         default (Optional[int]): The default value for the attribute.
@@ -299,10 +377,7 @@ def int_subelement(
     """
     value = get_value(obj, attr_name=attr_name, verbosity=verbosity, default=default)
     if value is not None:
-        subelement = config.etree.SubElement(
-            element,
-            f"{obj.ns}{node_name}",
-        )
+        subelement = _SubElement(element, qname)
         subelement.text = str(value)
 
 
@@ -312,6 +387,7 @@ def int_attribute(
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[int],
@@ -325,6 +401,7 @@ def int_attribute(
         element (Element): The parent element to add the subelement to.
         attr_name (str): The name of the attribute to retrieve the value from.
         node_name (str): The name of the attribute to be set.
+        qname (str): The qualified name of the attribute (unused).
         precision (Optional[int]): The precision of the attribute value.
         verbosity (Optional[Verbosity]): The verbosity level.
         default (Optional[int]): The default value for the attribute.
@@ -345,18 +422,20 @@ def float_subelement(
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[float],
 ) -> None:
-    """Set the value of an attribute from a subelement with a text node."""
+    """
+    Set the value of an attribute from a subelement with a text node.
+
+    The value is written with ``precision`` decimals, if it is given.
+    """
     value = get_value(obj, attr_name=attr_name, verbosity=verbosity, default=default)
     if value is not None:
-        subelement = config.etree.SubElement(
-            element,
-            f"{obj.ns}{node_name}",
-        )
-        subelement.text = str(value)
+        subelement = _SubElement(element, qname)
+        subelement.text = format_float(value, precision)
 
 
 def float_attribute(
@@ -365,14 +444,19 @@ def float_attribute(
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[float],
 ) -> None:
-    """Set the value of an attribute."""
+    """
+    Set the value of an attribute.
+
+    The value is written with ``precision`` decimals, if it is given.
+    """
     value = get_value(obj, attr_name=attr_name, verbosity=verbosity, default=default)
     if value is not None:
-        element.set(node_name, str(value))
+        element.set(node_name, format_float(value, precision))
 
 
 def enum_subelement(
@@ -381,6 +465,7 @@ def enum_subelement(
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[Enum],
@@ -388,10 +473,7 @@ def enum_subelement(
     """Set the value of an attribute from a subelement with a text node."""
     value = get_value(obj, attr_name=attr_name, verbosity=verbosity, default=default)
     if value is not None:
-        subelement = config.etree.SubElement(
-            element,
-            f"{obj.ns}{node_name}",
-        )
+        subelement = _SubElement(element, qname)
         subelement.text = value.value
 
 
@@ -401,6 +483,7 @@ def enum_attribute(
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[Enum],
@@ -411,12 +494,49 @@ def enum_attribute(
         element.set(node_name, value.value)
 
 
+def datetime_subelement(
+    obj: _XMLObject,
+    *,
+    element: Element,
+    attr_name: str,
+    node_name: str,
+    qname: str,
+    precision: Optional[int],
+    verbosity: Verbosity,
+    default: Any,
+) -> None:
+    """
+    Set the value of a KmlDateTime attribute as a subelement with a text node.
+
+    Args:
+    ----
+        obj (_XMLObject): The object from which to retrieve the attribute value.
+        element (Element): The parent element to add the subelement to.
+        attr_name (str): The name of the attribute to retrieve the value from.
+        node_name (str): The name of the subelement to create.
+        qname (str): The qualified name of the subelement to create.
+        precision (Optional[int]): The precision of the attribute value (unused).
+        verbosity (Verbosity): The verbosity level (unused).
+        default (Any): The default value of the attribute (unused).
+
+    Returns:
+    -------
+        None
+
+    """
+    value = getattr(obj, attr_name, None)
+    if value is not None and (text := str(value)):
+        subelement = _SubElement(element, qname)
+        subelement.text = text
+
+
 def xml_subelement(
     obj: _XMLObject,
     *,
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[_XMLObject],
@@ -430,6 +550,7 @@ def xml_subelement(
         element (Element): The XML element to which the subelement will be added.
         attr_name (str): The name of the attribute in the object.
         node_name (str): The name of the XML node for the subelement (unused).
+        qname (str): The qualified name of the XML node (unused).
         precision (Optional[int]): The precision for formatting numerical values.
         verbosity (Optional[Verbosity]): The verbosity level for the subelement.
         default (Optional[_XMLObject]): The default value for the attribute (unused).
@@ -439,9 +560,9 @@ def xml_subelement(
         None
 
     """
-    if getattr(obj, attr_name, None):
+    if value := getattr(obj, attr_name, None):
         element.append(
-            getattr(obj, attr_name).etree_element(
+            value.etree_element(
                 precision=precision,
                 verbosity=verbosity,
             ),
@@ -454,6 +575,7 @@ def xml_subelement_list(
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Verbosity,
     default: Optional[List[_XMLObject]],
@@ -467,6 +589,7 @@ def xml_subelement_list(
         element (Element): The XML element to which the subelements will be added.
         attr_name (str): The name of the list attribute in the object.
         node_name (str): The name of the XML node for each subelement (unused).
+        qname (str): The qualified name of the XML node (unused).
         precision (Optional[int]): The precision for floating-point values.
         verbosity (Optional[Verbosity]): The verbosity level for the XML output.
         default (Optional[List[_XMLObject]]): The default value for the attribute.
@@ -476,8 +599,8 @@ def xml_subelement_list(
         None
 
     """
-    if getattr(obj, attr_name, None):
-        for item in getattr(obj, attr_name):
+    if values := getattr(obj, attr_name, None):
+        for item in values:
             if item:
                 element.append(
                     item.etree_element(precision=precision, verbosity=verbosity),
@@ -487,111 +610,117 @@ def xml_subelement_list(
 def node_text_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, str]:
+) -> Tuple[bool, Optional[str]]:
     """
-    Extract the text content of an XML element and return it as a dictionary.
+    Extract the text content of an XML element.
 
     Args:
     ----
         element (Element): The XML element to extract the text content from.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the XML element.
         name_spaces (Dict[str, str]):
             A dictionary mapping namespace prefixes to their URIs.
-        node_name (str): The name of the XML node.
-        kwarg (str): The name of the keyword argument to store the text content in.
+        qname (str): The qualified name of the XML node (unused).
         classes (Tuple[known_types, ...]): A tuple of known types.
         strict (bool): A flag indicating whether to enforce strict parsing rules.
 
     Returns:
     -------
-        Dict[str, str]: A dictionary containing the keyword argument and its
-            corresponding text content, if it exists.
+        Tuple[bool, Optional[str]]: Whether the element has text content,
+            and the text content.
 
     """
-    return (
-        {kwarg: element.text.strip()} if element.text and element.text.strip() else {}
-    )
+    if element.text and (text := element.text.strip()):
+        return True, text
+    return False, None
 
 
 def subelement_text_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, str]:
+) -> Tuple[bool, Optional[str]]:
     """
-    Extract the text content of a subelement and return it as a dictionary.
+    Extract the text content of a subelement.
 
     Args:
     ----
         element (Element): The parent element.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the subelement.
         name_spaces (Dict[str, str]): A dictionary of namespace prefixes and URIs.
-        node_name (str): The name of the subelement.
-        kwarg (str): The key to use in the returned dictionary.
+        qname (str): The qualified name of the subelement.
         classes (Tuple[known_types, ...]): A tuple of known types.
         strict (bool): A flag indicating whether to enforce strict parsing.
 
     Returns:
     -------
-        Dict[str, str]: A dictionary containing the extracted text content,
-            with the specified key.
+        Tuple[bool, Optional[str]]: Whether the subelement has text content,
+            and the text content.
 
     """
-    node = element.find(f"{ns}{node_name}")
-    if node is None:
-        return {}
-    return {kwarg: node.text.strip()} if node.text and node.text.strip() else {}
+    if not (nodes := children.get(qname)):
+        return False, None
+    node = nodes[0]
+    if node.text and (text := node.text.strip()):
+        return True, text
+    return False, None
 
 
 def attribute_text_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, str]:
+) -> Tuple[bool, Optional[str]]:
     """
-    Return a dictionary representing the attribute as a keyword argument.
+    Extract the value of an attribute.
 
     Args:
     ----
         element (Element): The XML element.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the attribute.
         name_spaces (Dict[str, str]): A dictionary mapping namespace prefixes to URIs.
-        node_name (str): The name of the XML node.
-        kwarg (str): The name of the keyword argument.
+        qname (str): The qualified name of the attribute.
         classes (Tuple[known_types, ...]): A tuple of known types.
         strict (bool): A flag indicating whether to enforce strict parsing.
 
     Returns:
     -------
-        Dict[str, str]: A dictionary representing the attribute as a keyword argument.
+        Tuple[bool, Optional[str]]: Whether the attribute is set, and its value.
 
     """
-    attr = element.get(f"{ns}{node_name}")
-    return {kwarg: attr} if attr else {}
+    if attr := element.get(qname):
+        return True, attr
+    return False, None
 
 
 def _get_boolean_value(*, text: str, strict: bool) -> bool:
     if not strict:
         text = text.lower()
-    if text in {"1", "true"}:
+    if text in _TRUE_VALUES:
         return True
-    if text in {"0", "false"}:
+    if text in _FALSE_VALUES:
         return False
     if not strict:
         return bool(float(text))
@@ -602,29 +731,30 @@ def _get_boolean_value(*, text: str, strict: bool) -> bool:
 def subelement_bool_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, bool]:
+) -> Tuple[bool, Optional[bool]]:
     """
     Extract a boolean value from a subelement of an XML element.
 
     Args:
     ----
         element (Element): The XML element to search for the subelement.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the subelement.
         name_spaces (Dict[str, str]): A dictionary mapping namespace prefixes to URIs.
-        node_name (str): The name of the subelement.
-        kwarg (str): The name of the keyword argument to store the boolean value.
+        qname (str): The qualified name of the subelement.
         classes (Tuple[known_types, ...]): A tuple of known types.
         strict (bool): A flag indicating whether to enforce strict parsing.
 
     Returns:
     -------
-        Dict[str, bool]: A dictionary containing the keyword argument and its value.
+        Tuple[bool, Optional[bool]]: Whether a value was found, and the value.
 
     Raises:
     ------
@@ -633,12 +763,12 @@ def subelement_bool_kwarg(
     """
     assert len(classes) == 1  # noqa: S101
     assert issubclass(classes[0], bool)  # noqa: S101
-    node = element.find(f"{ns}{node_name}")
-    if node is None:
-        return {}
-    if node.text and node.text.strip():
+    if not (nodes := children.get(qname)):
+        return False, None
+    node = nodes[0]
+    if node.text and (text := node.text.strip()):
         try:
-            return {kwarg: _get_boolean_value(text=node.text.strip(), strict=strict)}
+            return True, _get_boolean_value(text=text, strict=strict)
         except ValueError as exc:
             handle_error(
                 error=exc,
@@ -647,47 +777,51 @@ def subelement_bool_kwarg(
                 node=node,
                 expected="Boolean",
             )
-    return {}
+    return False, None
 
 
 def subelement_int_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, int]:
+) -> Tuple[bool, Optional[int]]:
     """
     Extract an integer value from a subelement of an XML element.
 
+    The text is not stripped, ``int()`` and ``float()`` already ignore
+    surrounding whitespace.
+
     Args:
     ----
         element (Element): The XML element to search for the subelement.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the subelement.
         name_spaces (Dict[str, str]): A dictionary mapping namespace prefixes to URIs.
-        node_name (str): The name of the subelement.
-        kwarg (str): The key to use in the returned dictionary.
+        qname (str): The qualified name of the subelement.
         classes (Tuple[known_types, ...]): A tuple of known types for error handling.
         strict (bool): A flag indicating whether to enforce strict parsing.
 
     Returns:
     -------
-        Dict[str, int]: A dictionary containing the keyword argument and its value.
+        Tuple[bool, Optional[int]]: Whether a value was found, and the value.
 
     Raises:
     ------
         ValueError: If the value of the subelement is not a valid integer and strict.
 
     """
-    node = element.find(f"{ns}{node_name}")
-    if node is None:
-        return {}
-    if node.text and node.text.strip():
+    if not (nodes := children.get(qname)):
+        return False, None
+    node = nodes[0]
+    if node.text and not node.text.isspace():
         try:
-            return {kwarg: int(node.text.strip())}
+            return True, int(node.text)
         except ValueError as exc:
             handle_error(
                 error=exc,
@@ -696,79 +830,82 @@ def subelement_int_kwarg(
                 node=node,
                 expected="Integer",
             )
-    return {}
+    return False, None
 
 
 def attribute_int_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, int]:
+) -> Tuple[bool, Optional[int]]:
     """
-    Extract an integer attribute from an XML element and return it as a dictionary.
+    Extract an integer attribute from an XML element.
 
     Args:
     ----
         element (Element): The XML element to extract the attribute from.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the attribute.
         name_spaces (Dict[str, str]): A dictionary mapping namespace prefixes to URIs.
-        node_name (str): The name of the XML node containing the attribute.
-        kwarg (str): The name of the keyword argument to store the extracted attribute.
+        qname (str): The qualified name of the attribute.
         classes (Tuple[known_types, ...]): A tuple of known types (unused).
         strict (bool): A flag indicating whether to raise an exception (unused).
 
     Returns:
     -------
-        Dict[str, int]: A dictionary containing the extracted attribute value.
+        Tuple[bool, Optional[int]]: Whether the attribute is set, and its value.
 
     """
-    attr = element.get(f"{ns}{node_name}")
-    return {kwarg: int(attr)} if attr else {}
+    if attr := element.get(qname):
+        return True, int(attr)
+    return False, None
 
 
 def subelement_float_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, float]:
+) -> Tuple[bool, Optional[float]]:
     """
     Extract a float value from a subelement of an XML element.
 
     Args:
     ----
         element (Element): The XML element to search for the subelement.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the subelement.
         name_spaces (Dict[str, str]): A dictionary of namespace prefixes and URIs.
-        node_name (str): The name of the subelement.
-        kwarg (str): The name of the keyword argument to store the float value.
+        qname (str): The qualified name of the subelement.
         classes (Tuple[known_types, ...]): A tuple of known types for error handling.
         strict (bool): A flag indicating whether to raise an error.
 
     Returns:
     -------
-        Dict[str, float]: A dictionary containing the float value as a keyword argument.
+        Tuple[bool, Optional[float]]: Whether a value was found, and the value.
 
     Raises:
     ------
         ValueError: If the value of the subelement cannot be converted and strict.
 
     """
-    node = element.find(f"{ns}{node_name}")
-    if node is None:
-        return {}
-    if node.text and node.text.strip():
+    if not (nodes := children.get(qname)):
+        return False, None
+    node = nodes[0]
+    if node.text and not node.text.isspace():
         try:
-            return {kwarg: float(node.text.strip())}
+            return True, float(node.text)
         except ValueError as exc:
             handle_error(
                 error=exc,
@@ -777,53 +914,54 @@ def subelement_float_kwarg(
                 node=node,
                 expected="Float",
             )
-    return {}
+    return False, None
 
 
 def attribute_float_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, float]:
+) -> Tuple[bool, Optional[float]]:
     """
-    Convert an attribute value to a float and return it as a dictionary.
+    Convert an attribute value to a float.
 
     Args:
     ----
         element (Element): The XML element containing the attribute.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the attribute.
         name_spaces (Dict[str, str]): A dictionary of namespace prefixes and URIs.
-        node_name (str): The name of the attribute.
-        kwarg (str): The name of the keyword argument to store the converted float.
+        qname (str): The qualified name of the attribute.
         classes (Tuple[known_types, ...]): A tuple of known types for error handling.
         strict (bool): A flag indicating whether to raise an error for invalid values.
 
     Returns:
     -------
-        Dict[str, float]: A dictionary containing the float as a keyword argument.
+        Tuple[bool, Optional[float]]: Whether the attribute is set, and its value.
 
     Raises:
     ------
         ValueError: If the attribute value cannot be converted to a float.
 
     """
-    attr = element.get(f"{ns}{node_name}")
-    try:
-        return {kwarg: float(attr)} if attr else {}
-    except ValueError as exc:
-        handle_error(
-            error=exc,
-            strict=strict,
-            element=element,
-            node=element,
-            expected="Float",
-        )
-    return {}
+    if attr := element.get(qname):
+        try:
+            return True, float(attr)
+        except ValueError as exc:
+            handle_error(
+                error=exc,
+                strict=strict,
+                element=element,
+                node=element,
+                expected="Float",
+            )
+    return False, None
 
 
 def _get_enum_value(*, enum_class: Type[Enum], text: str, strict: bool) -> Enum:
@@ -837,29 +975,30 @@ def _get_enum_value(*, enum_class: Type[Enum], text: str, strict: bool) -> Enum:
 def subelement_enum_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, Enum]:
+) -> Tuple[bool, Optional[Enum]]:
     """
     Extract an enumerated value from a subelement of an XML element.
 
     Args:
     ----
         element (Element): The XML element to search for the subelement.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the subelement.
         name_spaces (Dict[str, str]): A dictionary of namespace prefixes and URIs.
-        node_name (str): The name of the subelement.
-        kwarg (str): The name of the keyword argument to store the extracted value.
+        qname (str): The qualified name of the subelement.
         classes (Tuple[known_types, ...]): A tuple of enumerated value classes.
         strict (bool): A flag indicating whether to raise an exception.
 
     Returns:
     -------
-        Dict[str, Enum]: A dictionary containing the extracted enumerated value.
+        Tuple[bool, Optional[Enum]]: Whether a value was found, and the value.
 
     Raises:
     ------
@@ -868,19 +1007,16 @@ def subelement_enum_kwarg(
     """
     assert len(classes) == 1  # noqa: S101
     assert issubclass(classes[0], Enum)  # noqa: S101
-    node = element.find(f"{ns}{node_name}")
-    if node is None:
-        return {}
-    node_text = node.text.strip() if node.text else ""
-    if node_text:
+    if not (nodes := children.get(qname)):
+        return False, None
+    node = nodes[0]
+    if node.text and (text := node.text.strip()):
         try:
-            return {
-                kwarg: _get_enum_value(
-                    enum_class=classes[0],
-                    text=node_text,
-                    strict=strict,
-                ),
-            }
+            return True, _get_enum_value(
+                enum_class=classes[0],
+                text=text,
+                strict=strict,
+            )
         except ValueError as exc:
             handle_error(
                 error=exc,
@@ -889,48 +1025,47 @@ def subelement_enum_kwarg(
                 node=node,
                 expected="Enum",
             )
-    return {}
+    return False, None
 
 
 def attribute_enum_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, Enum]:
+) -> Tuple[bool, Optional[Enum]]:
     """
-    Return a dictionary with the specified keyword argument and its enum value.
+    Extract an enumerated value from an attribute.
 
     Args:
     ----
         element (Element): The XML element.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the XML element.
         name_spaces (Dict[str, str]): A dictionary of namespace prefixes and their URIs.
-        node_name (str): The name of the XML node.
-        kwarg (str): The name of the keyword argument.
+        qname (str): The qualified name of the attribute.
         classes (Tuple[known_types, ...]): A tuple of enum classes.
         strict (bool): A flag indicating whether to raise an error for invalid values.
 
     Returns:
     -------
-        Dict[str, Enum]: A dictionary with the specified keyword argument and its value.
+        Tuple[bool, Optional[Enum]]: Whether a value was found, and the value.
 
     """
     assert len(classes) == 1  # noqa: S101
     assert issubclass(classes[0], Enum)  # noqa: S101
-    if raw := element.get(f"{ns}{node_name}"):
+    if raw := element.get(qname):
         try:
-            return {
-                kwarg: _get_enum_value(
-                    enum_class=classes[0],
-                    text=raw,
-                    strict=strict,
-                ),
-            }
+            return True, _get_enum_value(
+                enum_class=classes[0],
+                text=raw,
+                strict=strict,
+            )
         except ValueError as exc:
             handle_error(
                 error=exc,
@@ -939,97 +1074,92 @@ def attribute_enum_kwarg(
                 node=element,
                 expected="Enum",
             )
-    return {}
+    return False, None
 
 
 def xml_subelement_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, _XMLObject]:
+) -> Tuple[bool, Optional[_XMLObject]]:
     """
-    Return the subelement of the given XML element based on the provided parameters.
+    Return the object parsed from the first matching subelement of the element.
 
     Args:
     ----
     element (Element): The XML element to search within.
+    children (Dict[str, List[Element]]): The subelements of the element,
+        grouped by their tag.
     ns (str): The namespace of the XML element.
     name_spaces (Dict[str, str]): A dictionary mapping namespace prefixes to their URIs.
-    node_name (str): The name of the XML node to search for.
-    kwarg (str): The name of the keyword argument to store the found subelement.
+    qname (str): The qualified name of the XML node (unused).
     classes (Tuple[known_types, ...]): A tuple of classes that represent the types.
     strict (bool): A flag indicating whether to enforce strict parsing rules.
 
     Returns:
     -------
-    Dict[str, _XMLObject]: A dictionary containing the found subelement as the value
-        of the specified keyword argument.
+    Tuple[bool, Optional[_XMLObject]]: Whether a subelement was found,
+        and the object created from it.
 
     """
     for cls in classes:
         assert issubclass(cls, _XMLObject)  # noqa: S101
-        subelement = element.find(f"{ns}{cls.get_tag_name()}")
-        if subelement is not None:
-            return {
-                kwarg: cls.class_from_element(
-                    ns=ns,
-                    name_spaces=name_spaces,
-                    element=subelement,
-                    strict=strict,
-                ),
-            }
-    return {}
+        if subelements := children.get(class_qname(cls, ns)):
+            return True, cls.class_from_element(
+                ns=ns,
+                name_spaces=name_spaces,
+                element=subelements[0],
+                strict=strict,
+            )
+    return False, None
 
 
 def xml_subelement_list_kwarg(
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, List[_XMLObject]]:
+) -> Tuple[bool, List[_XMLObject]]:
     """
-    Return a dictionary with the specified keyword argument and its list of subelements.
+    Return the list of objects parsed from the matching subelements.
 
     Args:
     ----
         element (Element): The XML element to search within.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
         ns (str): The namespace of the XML element.
         name_spaces (Dict[str, str]): A dictionary mapping namespace prefixes to URIs.
-        node_name (str): The name of the XML node to search for.
-        kwarg (str): The name of the keyword argument to store the found subelements.
+        qname (str): The qualified name of the XML node (unused).
         classes (Tuple[known_types, ...]): A tuple of classes that represent the types.
         strict (bool): A flag indicating whether to enforce strict parsing rules.
 
     Returns:
     -------
-        Dict[str, List[_XMLObject]]: A dictionary containing the specified keyword
-            argument and its list of subelements.
+        Tuple[bool, List[_XMLObject]]: Always found, with the (possibly empty)
+            list of objects.
 
     """
-    args_list = []
-    assert node_name is not None  # noqa: S101
-    assert name_spaces is not None  # noqa: S101
+    args_list: List[_XMLObject] = []
     for obj_class in classes:
         assert issubclass(obj_class, _XMLObject)  # noqa: S101
-        if subelements := element.findall(f"{ns}{obj_class.get_tag_name()}"):
+        if subelements := children.get(class_qname(obj_class, ns)):
             args_list.extend(
-                [
-                    obj_class.class_from_element(
-                        ns=ns,
-                        name_spaces=name_spaces,
-                        element=subelement,
-                        strict=strict,
-                    )
-                    for subelement in subelements
-                ],
+                obj_class.class_from_element(
+                    ns=ns,
+                    name_spaces=name_spaces,
+                    element=subelement,
+                    strict=strict,
+                )
+                for subelement in subelements
             )
-    return {kwarg: args_list}
+    return True, args_list
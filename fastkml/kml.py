@@ -142,6 +142,7 @@ class KML(_XMLObject):
             element=root,
             attr_name="features",
             node_name="",
+            qname="",
             precision=precision,
             verbosity=verbosity,
             default=None,
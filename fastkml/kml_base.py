@@ -41,10 +41,12 @@ class _BaseObject(_XMLObject):
     mechanism is to be used.
     """
 
+    __slots__ = ("id", "target_id")
+
     _default_nsid = config.KML
 
-    id = None
-    target_id = None
+    id: Optional[str]
+    target_id: Optional[str]
 
     def __init__(
         self,
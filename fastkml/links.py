@@ -44,6 +44,17 @@ class Link(_BaseObject):
     https://developers.google.com/kml/documentation/kmlreference#link
     """
 
+    __slots__ = (
+        "href",
+        "http_query",
+        "refresh_interval",
+        "refresh_mode",
+        "view_bound_scale",
+        "view_format",
+        "view_refresh_mode",
+        "view_refresh_time",
+    )
+
     href: Optional[str]
     refresh_mode: Optional[RefreshMode]
     refresh_interval: Optional[float]
@@ -227,3 +238,5 @@ class Icon(Link):
     (often referred to as an icon palette).
 
     """
+
+    __slots__ = ()
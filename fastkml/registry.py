@@ -14,7 +14,9 @@
 # along with this library; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 """Registry for XML objects."""
+import sys
 from dataclasses import dataclass
+from dataclasses import field
 from enum import Enum
 from typing import TYPE_CHECKING
 from typing import Any
@@ -49,13 +51,13 @@ class GetKWArgs(Protocol):
         self,
         *,
         element: Element,
+        children: Dict[str, List[Element]],
         ns: str,
         name_spaces: Dict[str, str],
-        node_name: str,
-        kwarg: str,
+        qname: str,
         classes: Tuple[known_types, ...],
         strict: bool,
-    ) -> Dict[str, Any]: ...
+    ) -> Tuple[bool, Any]: ...
 
 
 class SetElement(Protocol):
@@ -66,6 +68,7 @@ class SetElement(Protocol):
         element: Element,
         attr_name: str,
         node_name: str,
+        qname: str,
         precision: Optional[int],
         verbosity: Verbosity,
         default: Any,
@@ -83,12 +86,42 @@ class RegistryItem:
     set_element: SetElement
     node_name: str
     default: Any = None
+    _tag_cache: Dict[str, str] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def qname(self, ns: str) -> str:
+        """
+        Return the qualified node name for the namespace, cached per namespace.
+
+        The name is interned, so every cached name is one shared string object.
+        """
+        tag = self._tag_cache.get(ns)
+        if tag is None:
+            tag = self._tag_cache[ns] = sys.intern(f"{ns}{self.node_name}")
+        return tag
+
+
+# set_element, attr_name, node_name, qname and default of a registry item
+Writer = Tuple[SetElement, str, str, str, Any]
+# get_kwarg, attr_name, classes and the (ns, qname) pairs to try of a registry item
+Reader = Tuple[GetKWArgs, str, Tuple[known_types, ...], Tuple[Tuple[str, str], ...]]
 
 
 class Registry:
     """A registry of XML objects."""
 
     _registry: Dict[Type["_XMLObject"], List[RegistryItem]]
+    _resolved: Dict[Type["_XMLObject"], Tuple[RegistryItem, ...]]
+    _writers: Dict[Tuple[Type["_XMLObject"], str], Tuple[Writer, ...]]
+    _ns_ids: Dict[Type["_XMLObject"], Tuple[str, ...]]
+    _readers: Dict[
+        Tuple[Type["_XMLObject"], Tuple[str, ...]],
+        Tuple[Reader, ...],
+    ]
 
     def __init__(
         self,
@@ -96,6 +129,10 @@ class Registry:
     ) -> None:
         """Initialize the registry."""
         self._registry = registry or {}
+        self._resolved = {}
+        self._writers = {}
+        self._ns_ids = {}
+        self._readers = {}
 
     def __repr__(self) -> str:
         """Create a string (c)representation for Registry."""
@@ -108,14 +145,147 @@ class Registry:
         existing = self._registry.get(cls, [])
         existing.append(item)
         self._registry[cls] = existing
+        self._resolved.clear()
+        self._writers.clear()
+        self._ns_ids.clear()
+        self._readers.clear()
+
+    def get(self, cls: Type["_XMLObject"]) -> Tuple[RegistryItem, ...]:
+        """
+        Get the registry items of a class, including those of its parents.
 
-    def get(self, cls: Type["_XMLObject"]) -> List[RegistryItem]:
-        """Get a class by name."""
-        parents = reversed(cls.__mro__[:-1])
-        items = []
-        for parent in parents:
-            items.extend(self._registry.get(parent, []))
-        return items
+        The result is cached per class, registering an item clears the cache.
+        """
+        resolved = self._resolved.get(cls)
+        if resolved is None:
+            items: List[RegistryItem] = []
+            for parent in reversed(cls.__mro__[:-1]):
+                items.extend(self._registry.get(parent, []))
+            resolved = self._resolved[cls] = tuple(items)
+        return resolved
+
+    def get_readers(
+        self,
+        cls: Type["_XMLObject"],
+        name_spaces: Dict[str, str],
+    ) -> Tuple[Reader, ...]:
+        """
+        Get the arguments to parse the items of a class.
+
+        The result is cached per class and the namespaces its items use,
+        so parsing an element does not resolve the qualified names again.
+        Registering an item clears the cache.
+        """
+        ns_ids = self._ns_ids.get(cls)
+        if ns_ids is None:
+            ns_ids = self._ns_ids[cls] = tuple(
+                sorted({ns_id for item in self.get(cls) for ns_id in item.ns_ids}),
+            )
+        key = (cls, tuple(name_spaces.get(ns_id, "") for ns_id in ns_ids))
+        readers = self._readers.get(key)
+        if readers is None:
+            readers = self._readers[key] = tuple(
+                (
+                    item.get_kwarg,
+                    item.attr_name,
+                    item.classes,
+                    tuple(
+                        (ns, item.qname(ns))
+                        for ns in (
+                            name_spaces.get(ns_id, "") for ns_id in item.ns_ids
+                        )
+                    ),
+                )
+                for item in self.get(cls)
+            )
+        return readers
+
+    def get_kwargs(
+        self,
+        cls: Type["_XMLObject"],
+        *,
+        element: Element,
+        name_spaces: Dict[str, str],
+        strict: bool,
+    ) -> Dict[str, Any]:
+        """
+        Get the keyword arguments for the class constructor from the element.
+
+        The subelements are grouped by tag in a single pass over the children,
+        so the getters look them up instead of searching the element each time.
+        """
+        children: Dict[str, List[Element]] = {}
+        for child in element:
+            children.setdefault(child.tag, []).append(child)
+        kwargs: Dict[str, Any] = {}
+        for get_kwarg, attr_name, classes, qnames in self.get_readers(
+            cls,
+            name_spaces,
+        ):
+            for ns, qname in qnames:
+                found, value = get_kwarg(
+                    element=element,
+                    children=children,
+                    ns=ns,
+                    name_spaces=name_spaces,
+                    qname=qname,
+                    classes=classes,
+                    strict=strict,
+                )
+                if found:
+                    kwargs[attr_name] = value
+                    break
+        return kwargs
+
+    def get_writers(
+        self,
+        cls: Type["_XMLObject"],
+        ns: str,
+    ) -> Tuple[Writer, ...]:
+        """
+        Get the arguments to serialize the items of a class in a namespace.
+
+        The result is cached per class and namespace, so serializing an object
+        only unpacks precomputed tuples.
+        Registering an item clears the cache.
+        """
+        writers = self._writers.get((cls, ns))
+        if writers is None:
+            writers = self._writers[(cls, ns)] = tuple(
+                (
+                    item.set_element,
+                    item.attr_name,
+                    item.node_name,
+                    item.qname(ns),
+                    item.default,
+                )
+                for item in self.get(cls)
+            )
+        return writers
+
+    def sub_element(
+        self,
+        obj: "_XMLObject",
+        *,
+        element: Element,
+        precision: Optional[int],
+        verbosity: Verbosity,
+    ) -> None:
+        """Add the registered attributes of the object to the element."""
+        for set_element, attr_name, node_name, qname, default in self.get_writers(
+            obj.__class__,
+            obj.ns,
+        ):
+            set_element(
+                obj=obj,
+                element=element,
+                attr_name=attr_name,
+                node_name=node_name,
+                qname=qname,
+                precision=precision,
+                verbosity=verbosity,
+                default=default,
+            )
 
 
 registry = Registry()
@@ -183,7 +183,6 @@ class _ColorStyle(_BaseObject):
     https://developers.google.com/kml/documentation/kmlreference#colorstyle
     """
 
-    id = None
     color = None
     # Color and opacity (alpha) values are expressed in hexadecimal notation.
     # The range of values for any one color is 0 to 255 (00 to ff).
@@ -19,15 +19,20 @@ from datetime import date
 from datetime import datetime
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import arrow
 
 from fastkml import config
 from fastkml.enums import DateTimeResolution
-from fastkml.enums import Verbosity
+from fastkml.helpers import datetime_subelement
 from fastkml.kml_base import _BaseObject
+from fastkml.registry import RegistryItem
+from fastkml.registry import known_types
+from fastkml.registry import registry
 from fastkml.types import Element
 
 # regular expression to parse a gYearMonth string
@@ -144,6 +149,41 @@ class KmlDateTime:
         return cls(dt, resolution) if dt else None
 
 
+def subelement_datetime_kwarg(
+    *,
+    element: Element,  # noqa: ARG001
+    children: Dict[str, List[Element]],
+    ns: str,  # noqa: ARG001
+    name_spaces: Dict[str, str],  # noqa: ARG001
+    qname: str,
+    classes: Tuple[known_types, ...],  # noqa: ARG001
+    strict: bool,  # noqa: ARG001
+) -> Tuple[bool, Optional[KmlDateTime]]:
+    """
+    Extract a KmlDateTime from a subelement.
+
+    Args:
+    ----
+        element (Element): The XML element containing the subelement.
+        children (Dict[str, List[Element]]): The subelements of the element,
+            grouped by their tag.
+        ns (str): The namespace of the XML element.
+        name_spaces (Dict[str, str]): A dictionary mapping namespace prefixes to URIs.
+        qname (str): The qualified name of the subelement.
+        classes (Tuple[known_types, ...]): A tuple of known types (unused).
+        strict (bool): A flag indicating whether to enforce strict parsing (unused).
+
+    Returns:
+    -------
+        Tuple[bool, Optional[KmlDateTime]]: Whether the subelement was found,
+            and the parsed date and time.
+
+    """
+    if (nodes := children.get(qname)) and (text := nodes[0].text):
+        return True, KmlDateTime.parse(text.strip())
+    return False, None
+
+
 class _TimePrimitive(_BaseObject):
     """
     Abstract element that cannot be used directly in a KML file.
@@ -152,6 +192,51 @@ class _TimePrimitive(_BaseObject):
     https://developers.google.com/kml/documentation/kmlreference#timeprimitive
     """
 
+    @classmethod
+    def _get_kwargs(
+        cls,
+        *,
+        ns: str,
+        name_spaces: Optional[Dict[str, str]] = None,
+        element: Element,
+        strict: bool,
+    ) -> Dict[str, Any]:
+        """
+        Get the keyword arguments for the time primitive.
+
+        The subelements are read in the namespace of the time primitive,
+        the namespace they are written in, rather than the kml namespace.
+
+        Parameters
+        ----------
+        ns : str
+            The namespace of the time primitive.
+        name_spaces : Optional[Dict[str, str]], optional
+            A dictionary of namespace prefixes and URIs, by default None
+        element : Element
+            The XML element.
+        strict : bool
+            Whether to enforce strict parsing.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The keyword arguments for the time primitive.
+
+        """
+        name_spaces = name_spaces or {}
+        name_spaces = {**config.NAME_SPACES, **name_spaces}
+        kwargs: Dict[str, Any] = {"ns": ns, "name_spaces": name_spaces}
+        kwargs.update(
+            registry.get_kwargs(
+                cls,
+                element=element,
+                name_spaces={**name_spaces, config.KML: ns},
+                strict=strict,
+            ),
+        )
+        return kwargs
+
 
 class TimeStamp(_TimePrimitive):
     """Represents a single moment in time."""
@@ -214,52 +299,6 @@ class TimeStamp(_TimePrimitive):
         """Return True if the timestamp is valid."""
         return bool(self.timestamp)
 
-    def etree_element(
-        self,
-        precision: Optional[int] = None,
-        verbosity: Verbosity = Verbosity.normal,
-    ) -> Element:
-        """
-        Create an ElementTree element representing the TimeStamp object.
-
-        Args:
-        ----
-            precision (Optional[int]): The precision of the timestamp.
-            verbosity (Verbosity): The verbosity level of the element.
-
-        Returns:
-        -------
-            Element: The ElementTree element representing the TimeStamp object.
-
-        """
-        element = super().etree_element(precision=precision, verbosity=verbosity)
-        when = config.etree.SubElement(
-            element,
-            f"{self.ns}when",
-        )
-        when.text = str(self.timestamp)
-        return element
-
-    @classmethod
-    def _get_kwargs(
-        cls,
-        *,
-        ns: str,
-        name_spaces: Optional[Dict[str, str]] = None,
-        element: Element,
-        strict: bool,
-    ) -> Dict[str, Any]:
-        kwargs = super()._get_kwargs(
-            ns=ns,
-            name_spaces=name_spaces,
-            element=element,
-            strict=strict,
-        )
-        when = element.find(f"{ns}when")
-        if when is not None:
-            kwargs["timestamp"] = KmlDateTime.parse(when.text)
-        return kwargs
-
 
 class TimeSpan(_TimePrimitive):
     """Represents an extent in time bounded by begin and end dateTimes."""
@@ -321,60 +360,37 @@ class TimeSpan(_TimePrimitive):
         """Return True if the begin or end date is valid."""
         return bool(self.begin) or bool(self.end)
 
-    def etree_element(
-        self,
-        precision: Optional[int] = None,
-        verbosity: Verbosity = Verbosity.normal,
-    ) -> Element:
-        """
-        Create an Element object representing the time interval.
-
-        Args:
-        ----
-            precision (Optional[int]): The precision of the time values.
-            verbosity (Verbosity): The verbosity level for the element.
-
-        Returns:
-        -------
-            Element: The created Element object.
-
-        """
-        element = super().etree_element(precision=precision, verbosity=verbosity)
-        if self.begin is not None:  # noqa: SIM102
-            if text := str(self.begin):
-                begin = config.etree.SubElement(
-                    element,
-                    f"{self.ns}begin",
-                )
-                begin.text = text
-        if self.end is not None:  # noqa: SIM102
-            if text := str(self.end):
-                end = config.etree.SubElement(
-                    element,
-                    f"{self.ns}end",
-                )
-                end.text = text
-        return element
 
-    @classmethod
-    def _get_kwargs(
-        cls,
-        *,
-        ns: str,
-        name_spaces: Optional[Dict[str, str]] = None,
-        element: Element,
-        strict: bool,
-    ) -> Dict[str, Any]:
-        kwargs = super()._get_kwargs(
-            ns=ns,
-            name_spaces=name_spaces,
-            element=element,
-            strict=strict,
-        )
-        begin = element.find(f"{ns}begin")
-        if begin is not None:
-            kwargs["begin"] = KmlDateTime.parse(begin.text)
-        end = element.find(f"{ns}end")
-        if end is not None:
-            kwargs["end"] = KmlDateTime.parse(end.text)
-        return kwargs
+registry.register(
+    TimeStamp,
+    RegistryItem(
+        ns_ids=("kml",),
+        attr_name="timestamp",
+        node_name="when",
+        classes=(KmlDateTime,),  # type: ignore[arg-type]
+        get_kwarg=subelement_datetime_kwarg,
+        set_element=datetime_subelement,
+    ),
+)
+registry.register(
+    TimeSpan,
+    RegistryItem(
+        ns_ids=("kml",),
+        attr_name="begin",
+        node_name="begin",
+        classes=(KmlDateTime,),  # type: ignore[arg-type]
+        get_kwarg=subelement_datetime_kwarg,
+        set_element=datetime_subelement,
+    ),
+)
+registry.register(
+    TimeSpan,
+    RegistryItem(
+        ns_ids=("kml",),
+        attr_name="end",
+        node_name="end",
+        classes=(KmlDateTime,),  # type: ignore[arg-type]
+        get_kwarg=subelement_datetime_kwarg,
+        set_element=datetime_subelement,
+    ),
+)
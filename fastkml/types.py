@@ -31,6 +31,7 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 """Types for fastkml."""
 from typing import Iterable
+from typing import Iterator
 from typing import Optional
 
 from typing_extensions import Protocol
@@ -61,3 +62,6 @@ class Element(Protocol):
 
     def remove(self, element: "Element") -> None:
         """Remove an element from the current element."""
+
+    def __iter__(self) -> Iterator["Element"]:
+        """Iterate over the subelements."""
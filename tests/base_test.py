@@ -15,7 +15,7 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 
 """Test the base classes."""
-
+import pickle
 
 from fastkml import base
 from fastkml import kml_base
@@ -140,6 +140,16 @@ class TestStdLibrary(StdLibrary):
         assert str(obj) == obj2.to_string()
         assert repr(obj) == repr(obj2)
 
+    def test_base_object_pickle(self) -> None:
+        obj = kml_base._BaseObject(id="id-0", target_id="target-id-0", custom=1)
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            obj2 = pickle.loads(pickle.dumps(obj, protocol=protocol))  # noqa: S301
+
+            assert obj == obj2
+            assert obj2.custom == 1
+            assert repr(obj) == repr(obj2)
+
 
 class TestLxml(Lxml, TestStdLibrary):
     """Test the base object with lxml."""
@@ -28,12 +28,15 @@ except ImportError:
     LXML = False
 
 from fastkml import config
+from fastkml import helpers
+from fastkml import links
 
 
 def test_set_etree_implementation_xml() -> None:
     config.set_etree_implementation(ET)
 
     assert config.etree.__name__ == "xml.etree.ElementTree"
+    assert helpers._SubElement is ET.SubElement
 
 
 @pytest.mark.skipif(not LXML, reason="lxml not installed")
@@ -41,6 +44,17 @@ def test_set_etree_implementation_lxml() -> None:
     config.set_etree_implementation(lxml.etree)
 
     assert config.etree.__name__ == "lxml.etree"
+    assert helpers._SubElement is lxml.etree.SubElement
+
+
+@pytest.mark.skipif(not LXML, reason="lxml not installed")
+def test_set_etree_implementation_to_string() -> None:
+    config.set_etree_implementation(lxml.etree)
+    config.set_etree_implementation(ET)
+
+    link = links.Link(href="http://example.com/")
+
+    assert "<kml:href>http://example.com/</kml:href>" in link.to_string()
 
 
 def test_register_namespaces() -> None:
@@ -82,6 +82,19 @@ class TestStdLibrary(StdLibrary):
 
         assert icon2.to_string() == icon.to_string()
 
+    def test_link_slots(self) -> None:
+        link = links.Link(href="http://example.com/", refresh_interval=60)
+
+        assert not link.__dict__
+        assert link == links.Link(href="http://example.com/", refresh_interval=60)
+        assert link != links.Link(href="http://example.com/", refresh_interval=30)
+
+    def test_link_extra_kwargs(self) -> None:
+        link = links.Link(href="http://example.com/", extra="value")
+
+        assert link.extra == "value"  # type: ignore[attr-defined]
+        assert link != links.Link(href="http://example.com/", extra="other")
+
 
 class TestLxml(Lxml, TestStdLibrary):
     """Test with lxml."""
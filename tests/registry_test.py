@@ -14,9 +14,11 @@
 # along with this library; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 """Test the registry module."""
+import sys
 from enum import Enum
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Type
@@ -64,6 +66,7 @@ def set_element(
     element: Element,
     attr_name: str,
     node_name: str,
+    qname: str,
     precision: Optional[int],
     verbosity: Optional[Verbosity],
     default: Any,
@@ -74,13 +77,13 @@ def set_element(
 def get_kwarg(  # type: ignore[empty-body]
     *,
     element: Element,
+    children: Dict[str, List[Element]],
     ns: str,
     name_spaces: Dict[str, str],
-    node_name: str,
-    kwarg: str,
+    qname: str,
     classes: Tuple[known_types, ...],
     strict: bool,
-) -> Dict[str, Any]:
+) -> Tuple[bool, Any]:
     """Get the kwarg for the constructor from the element."""
 
 
@@ -271,3 +274,102 @@ def test_registry_repr() -> None:
     registry = Registry()
 
     assert repr(registry) == "fastkml.registry.Registry({})"
+
+
+def test_registry_item_qname() -> None:
+    item = RegistryItem(
+        ns_ids=("kml",),
+        classes=(str,),
+        attr_name="a",
+        get_kwarg=get_kwarg,
+        set_element=set_element,
+        node_name="nodeName",
+    )
+
+    assert item.qname("{kml}") == "{kml}nodeName"
+    assert item.qname("") == "nodeName"
+    assert item.qname("{kml}") is item.qname("{kml}")
+    assert item.qname("{kml}") is sys.intern("{kml}nodeName")
+
+
+def test_registry_get_is_cached_and_invalidated() -> None:
+    registry = Registry()
+    registry.register(
+        A,
+        RegistryItem(
+            ns_ids=("kml",),
+            classes=(A,),
+            attr_name="a",
+            get_kwarg=get_kwarg,
+            set_element=set_element,
+            node_name="a",
+        ),
+    )
+
+    items = registry.get(B)
+
+    assert registry.get(B) is items
+    assert len(items) == 1
+
+    registry.register(
+        B,
+        RegistryItem(
+            ns_ids=("kml",),
+            classes=(B,),
+            attr_name="b",
+            get_kwarg=get_kwarg,
+            set_element=set_element,
+            node_name="b",
+        ),
+    )
+
+    assert len(registry.get(B)) == 2
+    assert registry.get(B)[1].attr_name == "b"
+
+
+def test_registry_get_writers() -> None:
+    registry = Registry()
+    registry.register(
+        A,
+        RegistryItem(
+            ns_ids=("kml",),
+            classes=(str,),
+            attr_name="a",
+            get_kwarg=get_kwarg,
+            set_element=set_element,
+            node_name="nodeA",
+            default="x",
+        ),
+    )
+
+    writers = registry.get_writers(B, "{kml}")
+
+    assert writers == ((set_element, "a", "nodeA", "{kml}nodeA", "x"),)
+    assert registry.get_writers(B, "{kml}") is writers
+    assert registry.get_writers(B, "")[0][3] == "nodeA"
+
+
+def test_registry_get_readers() -> None:
+    registry = Registry()
+    registry.register(
+        A,
+        RegistryItem(
+            ns_ids=("kml", ""),
+            classes=(str,),
+            attr_name="a",
+            get_kwarg=get_kwarg,
+            set_element=set_element,
+            node_name="nodeA",
+        ),
+    )
+
+    readers = registry.get_readers(B, {"kml": "{kml}", "gx": "{gx}"})
+
+    assert readers == (
+        (get_kwarg, "a", (str,), (("{kml}", "{kml}nodeA"), ("", "nodeA"))),
+    )
+    assert registry.get_readers(B, {"kml": "{kml}", "atom": "{atom}"}) is readers
+    assert registry.get_readers(B, {"kml": "{other}"})[0][3][0] == (
+        "{other}",
+        "{other}nodeA",
+    )
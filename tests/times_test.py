@@ -205,6 +205,12 @@ class TestStdLibrary(StdLibrary):
         assert ts.timestamp == y2k
         assert "2000-01-01" in str(ts.to_string())
 
+    def test_timestamp_without_timestamp(self) -> None:
+        ts = kml.TimeStamp()
+
+        assert "TimeStamp" in ts.to_string()
+        assert "when>" not in ts.to_string()
+
     def test_timespan(self) -> None:
         now = KmlDateTime(datetime.datetime.now())
         y2k = KmlDateTime(datetime.datetime(2000, 1, 1))
@@ -364,6 +370,27 @@ class TestStdLibrary(StdLibrary):
         assert ts.end.resolution == DateTimeResolution.datetime
         assert ts.end.dt == datetime.datetime(1997, 7, 16, 7, 30, 15, tzinfo=tzutc())
 
+    def test_read_timestamp_custom_ns(self) -> None:
+        doc = '<TimeStamp xmlns="urn:x"><when>2019-01-01</when></TimeStamp>'
+
+        ts = kml.TimeStamp.class_from_string(doc, ns="{urn:x}")
+
+        assert ts.timestamp.resolution == DateTimeResolution.date
+        assert ts.timestamp.dt == datetime.datetime(2019, 1, 1, tzinfo=tzutc())
+
+    def test_read_timespan_custom_ns(self) -> None:
+        doc = """
+        <TimeSpan xmlns="urn:x">
+            <begin>1876-08-01</begin>
+            <end>1997-07-16T07:30:15Z</end>
+        </TimeSpan>
+        """
+
+        ts = kml.TimeSpan.class_from_string(doc, ns="{urn:x}")
+
+        assert ts.begin.dt == datetime.datetime(1876, 8, 1, 0, 0, tzinfo=tzutc())
+        assert ts.end.dt == datetime.datetime(1997, 7, 16, 7, 30, 15, tzinfo=tzutc())
+
     def test_feature_fromstring(self) -> None:
         doc = """<Document xmlns="http://www.opengis.net/kml/2.2">
           <name>Document.kml</name>
@@ -175,6 +175,18 @@ class TestStdLibrary(StdLibrary):
         assert look_at.begin is None
         assert look_at.end is None
 
+    def test_look_at_read_whitespace(self) -> None:
+        look_at_xml = (
+            '<kml:LookAt xmlns:kml="http://www.opengis.net/kml/2.2">'
+            "<kml:heading>\n  10.5\n</kml:heading>"
+            "<kml:tilt>  </kml:tilt>"
+            "</kml:LookAt>"
+        )
+        look_at = views.LookAt.class_from_string(look_at_xml)
+
+        assert look_at.heading == 10.5
+        assert look_at.tilt is None
+
     def test_region_with_all_optional_parameters(self) -> None:
         """Region object can be initialized with all optional parameters."""
         region = views.Region(
@@ -250,6 +262,26 @@ class TestStdLibrary(StdLibrary):
         assert region.lat_lon_alt_box == lat_lon_alt_box
         assert region.lod is None
 
+    def test_look_at_to_string_precision(self) -> None:
+        look_at = views.LookAt(
+            heading=10.123456,
+            tilt=20,
+            latitude=50.5,
+        )
+
+        assert "heading>10.123456</" in look_at.to_string()
+        assert "heading>10.12</" in look_at.to_string(precision=2)
+        assert "heading>10.1</" in look_at.to_string(precision=1)
+        assert "tilt>20</" in look_at.to_string(precision=2)
+        assert "latitude>50.5</" in look_at.to_string(precision=2)
+
+    def test_look_at_to_string_precision_negative_zero(self) -> None:
+        look_at = views.LookAt(heading=-0.001, tilt=-0.4)
+
+        assert "heading>0</" in look_at.to_string(precision=2)
+        assert "tilt>0</" in look_at.to_string(precision=0)
+        assert "heading>-0.001</" in look_at.to_string(precision=3)
+
 
 class TestLxml(Lxml, TestStdLibrary):
     """Test with lxml."""